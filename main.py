@@ -1,26 +1,27 @@
-import requests
-from bs4 import BeautifulSoup
+import argparse
+import asyncio
+import codecs
+import aiohttp
+from bs4 import BeautifulSoup, Tag
+import lxml.html
+from lxml import etree
 from fake_useragent import UserAgent
 from collections import deque
-import json
+import orjson
 import re
-import time
 import random
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+import ciso8601
 from termcolor import colored
 from typing import List, Dict, Optional, Any
 from pydantic import BaseModel, HttpUrl, Field
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-import undetected_chromedriver as uc
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 from urllib.parse import urljoin, urlparse
+from pybloom_live import ScalableBloomFilter
+from blake3 import blake3
 import logging
+import ollama_cache
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -56,63 +57,271 @@ class JobPostingAPI(BaseModel):
 # --- OLLama Integration ---
 OLLAMA_API_URL = "http://localhost:11434/api/chat"
 OLLAMA_MODEL = "gemma3"
+# Link fields are taken from the parsed HTML only, never from the model
+OLLAMA_URL_FIELDS = ('apply_url', 'company_image')
+
+# --- HTTP Connection Pool / Retry Settings ---
+POOL_SIZE = 32
+KEEPALIVE_TIMEOUT = 85
+MAX_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+RETRY_AFTER_MAX = 120  # Cap on a server-requested Retry-After delay (seconds)
+# Job details sit near the top of a page; anything past this is not downloaded or parsed
+MAX_PAGE_BYTES = 512_000
+READ_CHUNK_SIZE = 65536
+
+# --- Precompiled Patterns ---
+# Link patterns are matched against an already lowercased URL, so no IGNORECASE
+JOB_KEYWORDS = ('job', 'career', 'hiring', 'work', 'position')
+_JOB_PATH_RE = re.compile(r'/job|/jobs|/careers|/apply|/view|/listing|/posting|/opportunities')
+_PAGINATION_RE = re.compile(r'page=\d+|start=\d+|offset=\d+|p=\d+')
+_JOB_KW_RE = re.compile('|'.join(map(re.escape, JOB_KEYWORDS)))
+_TIME_AGO_RE = re.compile(r'(\d+)\s+(day|hour|week|month|year)s?\s+ago', re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r'\s+')
+# Markers of an unrendered single-page-app shell
+_SPA_SHELL_RE = re.compile(
+    r'__NEXT_DATA__|id=["\']?(?:root|app|__next)["\'\s>]|<noscript|<body[^>]*>\s*(?:<script|</body>)|loading',
+    re.IGNORECASE
+)
+SPA_SHELL_MAX_CHARS = 1000
+# Link scanning re-encodes already decoded text as UTF-8
+_UTF8_HTML_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+
+# --- Job Page Field Heuristics ---
+# Per-field selectors in priority order, mirroring the original CSS selector lists.
+# Each entry is (tag or None, kind, value):
+#   'class'    -> [class*="value"]          'token'  -> .value
+#   'href'/'src' -> [href*="value"] etc.    'parent' -> .value <tag> (ancestor class)
+#   kind None  -> bare tag
+# The list index is the rank: a lower-ranked match replaces an earlier higher-ranked one.
+FIELD_SELECTORS = {
+    'job_title': [
+        ('h1', 'class', 'title'), ('h1', 'class', 'job'), ('h1', 'class', 'position'),
+        ('h2', 'class', 'title'), ('h2', 'class', 'job'), ('h2', 'class', 'position'),
+        (None, 'token', 'job-title'), (None, 'token', 'position-title'), (None, 'token', 'title'),
+        ('h1', None, None), ('h2', None, None),
+    ],
+    'job_description': [
+        (None, 'class', 'description'), (None, 'class', 'job-description'), (None, 'class', 'content'),
+        (None, 'class', 'details'), (None, 'class', 'requirements'),
+        (None, 'token', 'description'), (None, 'token', 'job-content'),
+    ],
+    'job_location': [
+        (None, 'class', 'location'), (None, 'class', 'address'), (None, 'class', 'remote'),
+        (None, 'token', 'location'), (None, 'token', 'job-location'), (None, 'token', 'address'),
+    ],
+    'apply_url': [
+        ('a', 'href', 'apply'), ('a', 'class', 'apply'), ('a', 'class', 'button'),
+        (None, 'token', 'apply-btn'), (None, 'token', 'apply-link'), (None, 'token', 'job-apply'),
+    ],
+    'company_image': [
+        ('img', 'src', 'logo'), ('img', 'class', 'logo'), ('img', 'class', 'company'),
+        ('img', 'parent', 'company-logo'), ('img', 'parent', 'logo'),
+    ],
+}
+
+# --- Crawl Frontier Settings ---
+# visited URLs are tracked in a Bloom filter; a rare false positive only skips a URL
+VISITED_INITIAL_CAPACITY = 10000
+VISITED_ERROR_RATE = 0.001
+
+# --- Headless Browser Settings ---
+BROWSER_CONCURRENCY = 3
+BROWSER_NAV_TIMEOUT_MS = 15000
+BROWSER_WAIT_MS = 8000
+# Heavy resources aborted at the network layer so JS-rendered pages load faster
+BLOCKED_RESOURCE_TYPES = frozenset(('image', 'font', 'stylesheet', 'media'))
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into a capped delay"""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+    return min(max(seconds, 0.0), RETRY_AFTER_MAX)
+
+def _selector_rank(node: Tag, cls: str, class_tokens: List[str], selectors: list,
+                   limit: Optional[int] = None) -> Optional[int]:
+    """Index of the first selector in the list matching node, if better than limit"""
+    ranked = selectors if limit is None else selectors[:limit]
+    for rank, (tag, kind, value) in enumerate(ranked):
+        if tag and node.name != tag:
+            continue
+        if kind is None:
+            return rank
+        if kind == 'class':
+            if value in cls:
+                return rank
+        elif kind == 'token':
+            if value in class_tokens:
+                return rank
+        elif kind == 'parent':
+            if node.find_parent(class_=value):
+                return rank
+        elif value in (node.get(kind) or ''):
+            return rank
+    return None
+
+def _field_value(node: Tag, field: str, url: str) -> Optional[str]:
+    """Extract a field value from a matching element, or None if it isn't usable"""
+    if field == 'job_description':
+        desc_text = node.get_text(separator='\n', strip=True)
+        if len(desc_text) > 100:  # Ensure it's substantial
+            return desc_text[:2000]  # Limit length
+        return None
+    if field == 'apply_url':
+        return urljoin(url, node['href']) if node.get('href') else None
+    if field == 'company_image':
+        return urljoin(url, node['src']) if node.get('src') else None
+    return node.get_text(strip=True) or None
+
+def _normalize_ollama_data(parsed_data: dict) -> dict:
+    """Post-process raw OLLama output into scraper field values"""
+    # The model only sees page text, so any URLs it returns would be invented
+    for key in OLLAMA_URL_FIELDS:
+        parsed_data.pop(key, None)
+
+    # Parse date if provided
+    if parsed_data.get('date_posted'):
+        parsed_data['date_posted'] = parse_date_string(parsed_data['date_posted'])
+
+    return parsed_data
+
+class _JsonObjectTracker:
+    """Incrementally tracks streamed text until the first top-level JSON object closes"""
+
+    def __init__(self):
+        self.buffer = []
+        self.length = 0
+        self.start = None
+        self.end = None
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, chunk: str) -> bool:
+        """Append chunk; returns True once a complete object has been seen"""
+        offset = self.length
+        self.buffer.append(chunk)
+        self.length += len(chunk)
+
+        for i, ch in enumerate(chunk):
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == '\\':
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"' and self.start is not None:
+                self._in_string = True
+            elif ch == '{':
+                if self.start is None:
+                    self.start = offset + i
+                self._depth += 1
+            elif ch == '}' and self.start is not None:
+                self._depth -= 1
+                if self._depth == 0:
+                    self.end = offset + i + 1
+                    return True
+        return False
 
-def get_job_details_with_ollama(html_content: str, url: str) -> dict:
+    @property
+    def text(self) -> str:
+        return ''.join(self.buffer)
+
+    @property
+    def json_text(self) -> Optional[str]:
+        """The completed object, or None if the stream ended before it closed"""
+        if self.end is None:
+            return None
+        return self.text[self.start:self.end]
+
+async def get_job_details_with_ollama(session: aiohttp.ClientSession, soup: BeautifulSoup, url: str,
+                                      use_cache: bool = True) -> dict:
     """
-    Uses OLLama (Gemma 3) to identify and extract job details from HTML content
+    Uses OLLama (Gemma 3) to identify and extract job details from an already parsed page
     """
-    truncated_html = html_content[:8000]
+    # Send 8000 chars of visible text rather than 8000 chars of markup
+    page_text = _WHITESPACE_RE.sub(' ', soup.get_text(' ', strip=True))[:8000]
+
+    # Identical pages skip the model call entirely
+    cache_key = ollama_cache.make_key(OLLAMA_MODEL, url, page_text)
+    if use_cache:
+        cached_data = ollama_cache.get(cache_key)
+        if cached_data is not None:
+            logger.info(f"OLLama cache hit for {url}")
+            return _normalize_ollama_data(cached_data)
 
     prompt = f"""
-    Analyze the following HTML content from {url} and extract job details.
+    Analyze the following text content of the web page {url} and extract job details.
     Look for:
     - Job Title (most prominent heading for the job)
     - Job Description (the main body of text describing the role, responsibilities, and qualifications)
     - Job Location (e.g., "Remote", "New York", "London, UK")
-    - Apply URL (a direct link or button URL to apply for the job, or use the current URL if no direct link)
-    - Company Image (URL of the company's logo or a relevant image, if present)
     - Date Posted (the date the job was posted, or "X days/hours ago", try to convert to YYYY-MM-DD if possible)
 
     Return ONLY a JSON object with these keys. If a field is not found, set it to null.
-    Ensure apply_url is a valid URL. If it's a relative URL, make it absolute using the base domain.
 
-    HTML Content:
-    {truncated_html}
+    Page Text:
+    {page_text}
     """
 
     headers = {'Content-Type': 'application/json'}
     payload = {
         "model": OLLAMA_MODEL,
         "messages": [{"role": "user", "content": prompt}],
-        "stream": False
+        "stream": True
     }
 
     try:
-        response = requests.post(OLLAMA_API_URL, headers=headers, json=payload, timeout=60)
-        response.raise_for_status()
-        
-        response_data = response.json()
+        tracker = _JsonObjectTracker()
+        received_message = False
+
+        async with session.post(OLLAMA_API_URL, headers=headers, data=orjson.dumps(payload),
+                                timeout=aiohttp.ClientTimeout(total=60)) as response:
+            response.raise_for_status()
+
+            # Consume NDJSON chunks and stop as soon as the JSON object is complete,
+            # so the model doesn't keep generating trailing text we would discard
+            async for line in response.content:
+                if not line.strip():
+                    continue
+                chunk = orjson.loads(line)
+                if 'message' in chunk and 'content' in chunk['message']:
+                    received_message = True
+                    if tracker.feed(chunk['message']['content']):
+                        response.close()
+                        break
+                if chunk.get('done'):
+                    break
         
-        if 'message' in response_data and 'content' in response_data['message']:
-            content_str = response_data['message']['content']
-            
-            # Clean up markdown formatting
-            if content_str.startswith("```json") and content_str.endswith("```"):
-                content_str = content_str[7:-3].strip()
-            elif content_str.startswith("```") and content_str.endswith("```"):
-                content_str = content_str[3:-3].strip()
-            
-            parsed_data = json.loads(content_str)
+        if received_message:
+            content_str = tracker.json_text
+            if content_str is None:
+                content_str = tracker.text.strip()
+
+                # Clean up markdown formatting
+                if content_str.startswith("```json") and content_str.endswith("```"):
+                    content_str = content_str[7:-3].strip()
+                elif content_str.startswith("```") and content_str.endswith("```"):
+                    content_str = content_str[3:-3].strip()
             
-            # Make apply_url absolute
-            if parsed_data.get('apply_url') and not parsed_data['apply_url'].startswith(('http://', 'https://')):
-                parsed_data['apply_url'] = urljoin(url, parsed_data['apply_url'])
+            parsed_data = orjson.loads(content_str)
 
-            # Parse date if provided
-            if parsed_data.get('date_posted'):
-                parsed_data['date_posted'] = parse_date_string(parsed_data['date_posted'])
+            if use_cache and isinstance(parsed_data, dict):
+                ollama_cache.set(cache_key, parsed_data)
 
-            return parsed_data
+            return _normalize_ollama_data(parsed_data)
         else:
             logger.error(f"Invalid OLLama response structure for {url}")
             return {}
@@ -121,35 +330,42 @@ def get_job_details_with_ollama(html_content: str, url: str) -> dict:
         logger.error(f"OLLama API error for {url}: {e}")
         return {}
 
+# Non-ISO formats tried after the ciso8601 fast path
+DATE_FORMATS = ("%B %d, %Y", "%d %B %Y", "%m/%d/%Y", "%d/%m/%Y")
+
+_UNIT_DELTA = {
+    'day': lambda n: timedelta(days=n),
+    'hour': lambda n: timedelta(hours=n),
+    'week': lambda n: timedelta(weeks=n),
+    'month': lambda n: timedelta(days=n * 30),
+    'year': lambda n: timedelta(days=n * 365),
+}
+
 def parse_date_string(date_str: str) -> Optional[datetime]:
     """Parse various date formats"""
     if not date_str:
         return None
         
     try:
+        # ISO 8601 (including plain YYYY-MM-DD) is parsed in C
+        try:
+            return ciso8601.parse_datetime(date_str)
+        except ValueError:
+            pass
+
         # Try common formats
-        for fmt in ("%Y-%m-%d", "%B %d, %Y", "%d %B %Y", "%m/%d/%Y", "%d/%m/%Y"):
+        for fmt in DATE_FORMATS:
             try:
                 return datetime.strptime(date_str, fmt)
             except ValueError:
                 continue
         
         # Handle "X days/hours ago"
-        time_ago_match = re.search(r'(\d+)\s+(day|hour|week|month|year)s?\s+ago', date_str, re.IGNORECASE)
+        time_ago_match = _TIME_AGO_RE.search(date_str)
         if time_ago_match:
             num = int(time_ago_match.group(1))
             unit = time_ago_match.group(2).lower()
-            
-            if unit == 'day':
-                return datetime.now() - timedelta(days=num)
-            elif unit == 'hour':
-                return datetime.now() - timedelta(hours=num)
-            elif unit == 'week':
-                return datetime.now() - timedelta(weeks=num)
-            elif unit == 'month':
-                return datetime.now() - timedelta(days=num * 30)
-            elif unit == 'year':
-                return datetime.now() - timedelta(days=num * 365)
+            return datetime.now() - _UNIT_DELTA[unit](num)
                 
     except Exception as e:
         logger.warning(f"Could not parse date '{date_str}': {e}")
@@ -157,205 +373,339 @@ def parse_date_string(date_str: str) -> Optional[datetime]:
     return None
 
 # --- API Integration ---
-def push_job_to_api(job_data: dict) -> bool:
+API_URL = "http://localhost:8080/jobs"
+API_BULK_URL = f"{API_URL}/bulk"
+API_BATCH_SIZE = 20
+
+# Bulk push outcomes
+BULK_OK = "ok"
+BULK_UNSUPPORTED = "unsupported"  # 404/405: no bulk endpoint, push individually from now on
+BULK_REJECTED = "rejected"        # other 4xx: nothing was stored, safe to retry individually
+BULK_FAILED = "failed"            # 5xx/timeout: some jobs may be stored, don't resend
+
+def build_api_payload(job_data: dict) -> bytes:
     """
-    Push job data to the API endpoint
+    Transform scraped job data to match the API schema, serialized to JSON bytes
     """
-    api_url = "http://localhost:8080/jobs"
+    api_job = JobPostingAPI(
+        job_title=job_data.get('job_title', ''),
+        job_description=job_data.get('job_description', ''),
+        apply_url=str(job_data.get('apply_url', '')),
+        company_image=job_data.get('company_image'),
+        date_posted=job_data.get('date_posted')
+    )
     
+    # pydantic-core serializes straight to JSON (datetimes as ISO 8601)
+    return api_job.model_dump_json(exclude_none=True).encode()
+
+async def push_job_to_api(session: aiohttp.ClientSession, body: bytes, job_title: str) -> bool:
+    """
+    Push a single serialized job to the API endpoint
+    """
     try:
-        # Transform data to match API schema
-        api_job = JobPostingAPI(
-            job_title=job_data.get('job_title', ''),
-            job_description=job_data.get('job_description', ''),
-            apply_url=str(job_data.get('apply_url', '')),
-            company_image=job_data.get('company_image'),
-            date_posted=job_data.get('date_posted')
-        )
-        
-        # Convert to dict for API
-        payload = api_job.model_dump(exclude_none=True)
-        if payload.get('date_posted'):
-            payload['date_posted'] = payload['date_posted'].isoformat()
-        
-        response = requests.post(api_url, json=payload, timeout=30)
-        response.raise_for_status()
+        headers = {'Content-Type': 'application/json'}
+        async with session.post(API_URL, data=body, headers=headers,
+                                timeout=aiohttp.ClientTimeout(total=30)) as response:
+            response.raise_for_status()
         
-        logger.info(f"Successfully pushed job '{job_data.get('job_title')}' to API")
+        logger.info(f"Successfully pushed job '{job_title}' to API")
         return True
         
-    except requests.exceptions.RequestException as e:
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
         logger.error(f"API request failed: {e}")
         return False
     except Exception as e:
         logger.error(f"Error pushing job to API: {e}")
         return False
 
+async def push_jobs_to_api_bulk(session: aiohttp.ClientSession, bodies: List[bytes]) -> str:
+    """
+    Push a batch of serialized jobs in a single request as a JSON array.
+    Returns one of the BULK_* outcomes.
+    """
+    try:
+        headers = {'Content-Type': 'application/json'}
+        body = b'[' + b','.join(bodies) + b']'
+        async with session.post(API_BULK_URL, data=body, headers=headers,
+                                timeout=aiohttp.ClientTimeout(total=30)) as response:
+            if response.status in (404, 405):
+                return BULK_UNSUPPORTED
+            if 400 <= response.status < 500:
+                logger.error(f"Bulk API request rejected: HTTP {response.status}")
+                return BULK_REJECTED
+            response.raise_for_status()
+
+        logger.info(f"Successfully pushed {len(bodies)} jobs to API")
+        return BULK_OK
+
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.error(f"Bulk API request failed: {e}")
+        return BULK_FAILED
+    except Exception as e:
+        logger.error(f"Error pushing jobs to API: {e}")
+        return BULK_FAILED
+
 # --- Enhanced Job Scraper Class ---
 class EnhancedJobScraper:
-    def __init__(self, urls_file: str, delay: int = 3, timeout: int = 20, use_selenium: bool = True):
+    def __init__(self, urls_file: str, delay: int = 3, timeout: int = 20, use_browser: bool = True,
+                 concurrency: int = 10, per_domain_concurrency: int = 5, use_cache: bool = True):
         self.urls_file = urls_file
         self.ua = UserAgent()
         self.delay = delay
         self.timeout = timeout
-        self.use_selenium = use_selenium
+        self.use_browser = use_browser
+        self.concurrency = concurrency
+        self.per_domain_concurrency = per_domain_concurrency
+        self.use_cache = use_cache
         self.scraped_jobs = []
-        self.visited_urls = set()
-        self.queue = deque()
+        self._pending: List[tuple] = []  # (job_data, serialized api payload) awaiting push
+        self._bulk_supported = True
+        self._content_hashes = set()  # blake3 digests of pages already parsed
         self.max_pages_per_domain = 30
-        self.driver = None
-        self.session = requests.Session()
-        self._setup_session()
-        
-    def _setup_session(self):
-        """Setup requests session with anti-blocking measures"""
-        self.session.headers.update({
+        self._playwright = None
+        self._browser = None
+        self._browser_lock: Optional[asyncio.Lock] = None
+        self._browser_semaphore: Optional[asyncio.Semaphore] = None
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._domain_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def _setup_session(self) -> aiohttp.ClientSession:
+        """Setup aiohttp session with anti-blocking measures"""
+        # Keep-alive pool so repeated requests to the same host reuse the TCP+TLS connection
+        connector = aiohttp.TCPConnector(limit=POOL_SIZE, limit_per_host=POOL_SIZE,
+                                         keepalive_timeout=KEEPALIVE_TIMEOUT, ssl=False)
+        return aiohttp.ClientSession(connector=connector, headers={
             'User-Agent': self.ua.random,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
+            'Accept-Encoding': 'gzip, deflate, br',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         })
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Lazily create the shared session (must be called inside the event loop)"""
+        if self.session is None or self.session.closed:
+            self.session = self._setup_session()
+        return self.session
+
+    def _get_semaphores(self, url: str):
+        """Return the global and per-domain semaphores gating requests to url"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        domain = urlparse(url).netloc
+        if domain not in self._domain_semaphores:
+            self._domain_semaphores[domain] = asyncio.Semaphore(self.per_domain_concurrency)
+        return self._semaphore, self._domain_semaphores[domain]
         
-    def _get_selenium_driver(self):
-        """Setup undetected Chrome driver for JS-heavy sites"""
-        if self.driver is None:
-            try:
-                options = uc.ChromeOptions()
-                options.add_argument('--headless')
-                options.add_argument('--no-sandbox')
-                options.add_argument('--disable-dev-shm-usage')
-                options.add_argument('--disable-blink-features=AutomationControlled')
-                options.add_experimental_option("excludeSwitches", ["enable-automation"])
-                options.add_experimental_option('useAutomationExtension', False)
-                options.add_argument('--disable-extensions')
-                options.add_argument('--disable-plugins')
-                options.add_argument('--disable-images')
-                options.add_argument('--disable-javascript')  # Can be removed if JS is needed
-                
-                self.driver = uc.Chrome(options=options)
-                self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-                
-            except Exception as e:
-                logger.error(f"Failed to setup Selenium driver: {e}")
-                self.use_selenium = False
-        
-        return self.driver
+    async def _get_browser(self):
+        """Lazily launch one shared headless Chromium for JS-heavy sites"""
+        if self._browser_lock is None:
+            self._browser_lock = asyncio.Lock()
+            self._browser_semaphore = asyncio.Semaphore(BROWSER_CONCURRENCY)
+
+        async with self._browser_lock:
+            if self._browser is None or not self._browser.is_connected():
+                try:
+                    if self._playwright is None:
+                        self._playwright = await async_playwright().start()
+                    self._browser = await self._playwright.chromium.launch(headless=True, args=[
+                        '--no-sandbox',
+                        '--disable-dev-shm-usage',
+                        '--disable-blink-features=AutomationControlled',
+                        '--disable-extensions',
+                    ])
+                except Exception as e:
+                    logger.error(f"Failed to launch headless browser: {e}")
+                    self.use_browser = False
+                    return None
+
+        return self._browser
+
+    @staticmethod
+    async def _block_heavy_resources(route):
+        """Abort images, fonts, stylesheets and media before they are downloaded"""
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
 
     def _load_start_urls(self) -> List[str]:
         """Load starting URLs from JSON file"""
         try:
-            with open(self.urls_file, 'r') as f:
-                data = json.load(f)
+            with open(self.urls_file, 'rb') as f:
+                data = orjson.loads(f.read())
                 return data.get('urls', [])
         except FileNotFoundError:
             logger.error(f"{self.urls_file} not found")
             return []
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             logger.error(f"Invalid JSON in {self.urls_file}")
             return []
 
-    def _fetch_page_requests(self, url: str) -> Optional[str]:
-        """Fetch page using requests with anti-blocking measures"""
+    @staticmethod
+    def _response_encoding(response: aiohttp.ClientResponse) -> str:
+        """Declared charset if Python knows the codec, otherwise utf-8"""
+        charset = response.charset
+        if charset:
+            try:
+                codecs.lookup(charset)
+                return charset
+            except LookupError:
+                pass
+        return 'utf-8'
+
+    async def _fetch_page_requests(self, url: str) -> Optional[str]:
+        """Fetch page using aiohttp with anti-blocking measures"""
+        session = self._get_session()
+        global_sem, domain_sem = self._get_semaphores(url)
+
+        # Rotate user agent per request (session headers are shared between tasks)
+        headers = {'User-Agent': self.ua.random}
+
+        # Add random headers
+        if random.choice([True, False]):
+            headers['Referer'] = 'https://www.google.com/'
+
         try:
-            # Random delay
-            time.sleep(random.uniform(self.delay, self.delay + 2))
-            
-            # Rotate user agent
-            self.session.headers['User-Agent'] = self.ua.random
-            
-            # Add random headers
-            if random.choice([True, False]):
-                self.session.headers['Referer'] = 'https://www.google.com/'
-            
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            
-            return response.text
-            
-        except requests.exceptions.RequestException as e:
+            async with global_sem, domain_sem:
+                # Random delay
+                await asyncio.sleep(random.uniform(self.delay, self.delay + 2))
+
+                for attempt in range(MAX_RETRIES + 1):
+                    retry_delay = RETRY_BACKOFF_FACTOR * (2 ** attempt)
+                    try:
+                        async with session.get(url, headers=headers,
+                                               timeout=aiohttp.ClientTimeout(total=self.timeout)) as response:
+                            # Back off and retry on rate limiting / transient server errors
+                            if response.status in RETRY_STATUSES and attempt < MAX_RETRIES:
+                                retry_after = _retry_after_seconds(response.headers.get('Retry-After'))
+                                if retry_after is not None:
+                                    retry_delay = retry_after
+                                logger.warning(f"HTTP {response.status} for {url}, retrying in {retry_delay:.1f}s")
+                            else:
+                                response.raise_for_status()
+
+                                # Stream the body and stop once the size cap is reached
+                                buf = bytearray()
+                                async for chunk in response.content.iter_chunked(READ_CHUNK_SIZE):
+                                    buf += chunk
+                                    if len(buf) >= MAX_PAGE_BYTES:
+                                        break
+                                return buf[:MAX_PAGE_BYTES].decode(self._response_encoding(response),
+                                                                   errors='replace')
+
+                    except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                        # Connection resets, refused connects and timeouts are retried too
+                        if attempt == MAX_RETRIES:
+                            raise
+                        logger.warning(f"Request error for {url} ({e!r}), retrying in {retry_delay:.1f}s")
+
+                    await asyncio.sleep(retry_delay)
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             logger.error(f"Request failed for {url}: {e}")
             return None
 
-    def _fetch_page_selenium(self, url: str) -> Optional[str]:
-        """Fetch page using Selenium for JS-heavy sites"""
-        driver = self._get_selenium_driver()
-        if not driver:
-            return None
-            
-        try:
-            driver.get(url)
-            
-            # Wait for page to load
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            
-            # Additional wait for dynamic content
-            time.sleep(random.uniform(2, 4))
-            
-            # Scroll to load more content if needed
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)
-            
-            return driver.page_source
-            
-        except Exception as e:
-            logger.error(f"Selenium failed for {url}: {e}")
+    async def _fetch_page_browser(self, url: str) -> Optional[str]:
+        """Fetch page in a fresh context of the shared browser for JS-heavy sites"""
+        browser = await self._get_browser()
+        if not browser:
             return None
 
-    def _fetch_page(self, url: str) -> Optional[str]:
+        async with self._browser_semaphore:
+            context = None
+            try:
+                context = await browser.new_context(user_agent=self.ua.random)
+                await context.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+                await context.route('**/*', self._block_heavy_resources)
+
+                page = await context.new_page()
+                await page.goto(url, wait_until='domcontentloaded', timeout=BROWSER_NAV_TIMEOUT_MS)
+
+                # Wait until job content (or at least a heading) has rendered
+                try:
+                    await page.wait_for_selector('[class*="job"], h1', timeout=BROWSER_WAIT_MS)
+                except PlaywrightTimeoutError:
+                    pass  # Use whatever has rendered so far
+
+                # Scroll to load more content if needed
+                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+
+                return await page.content()
+
+            except Exception as e:
+                logger.error(f"Headless browser failed for {url}: {e}")
+                return None
+            finally:
+                if context:
+                    await context.close()
+
+    @staticmethod
+    def _looks_js_heavy(html_content: str) -> bool:
+        """A tiny document carrying SPA shell markers needs JS rendering"""
+        # Length is checked first, so the regex only ever scans a small page
+        return len(html_content) < SPA_SHELL_MAX_CHARS and bool(_SPA_SHELL_RE.search(html_content))
+
+    async def _fetch_page(self, url: str) -> Optional[str]:
         """Fetch page with fallback strategy"""
         logger.info(f"Fetching: {url}")
         
-        # Try requests first (faster)
-        html_content = self._fetch_page_requests(url)
+        # Try aiohttp first (faster)
+        html_content = await self._fetch_page_requests(url)
         
-        # Fallback to Selenium if requests fails or if we detect JS-heavy content
-        if not html_content and self.use_selenium:
-            logger.info(f"Trying Selenium for {url}")
-            html_content = self._fetch_page_selenium(url)
+        # Fallback to the headless browser if the request fails
+        if not html_content and self.use_browser:
+            logger.info(f"Trying headless browser for {url}")
+            return await self._fetch_page_browser(url)
         
-        # Check if page seems to be JS-heavy and retry with Selenium
-        if html_content and self.use_selenium:
-            if len(html_content) < 1000 or 'loading' in html_content.lower():
-                logger.info(f"Page seems JS-heavy, retrying with Selenium for {url}")
-                selenium_content = self._fetch_page_selenium(url)
-                if selenium_content and len(selenium_content) > len(html_content):
-                    html_content = selenium_content
+        # Check if page seems to be JS-heavy and retry with the headless browser
+        if html_content and self.use_browser:
+            if self._looks_js_heavy(html_content):
+                logger.info(f"Page seems JS-heavy, retrying with headless browser for {url}")
+                browser_content = await self._fetch_page_browser(url)
+                if browser_content and len(browser_content) > len(html_content):
+                    html_content = browser_content
         
         return html_content
 
-    def _extract_links(self, html_content: str, base_url: str) -> List[str]:
+    def _extract_links(self, html_content: str, base_url: str, visited_urls: ScalableBloomFilter) -> List[str]:
         """Extract relevant job-related links"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        # Only raw href strings are needed, so skip BS4 and read them straight from libxml2
+        # Parse as bytes (lxml rejects str input that carries an XML encoding declaration),
+        # stating the encoding so libxml2 doesn't guess from meta tags
+        try:
+            tree = lxml.html.fromstring(html_content.encode('utf-8'), parser=_UTF8_HTML_PARSER)
+        except (ValueError, etree.ParserError):
+            return []
+
         links = []
-        base_domain = urlparse(base_url).netloc
+        base_domain = urlparse(base_url).netloc.lower()
         
-        for a_tag in soup.find_all('a', href=True):
-            href = a_tag['href']
+        for href in tree.xpath('//a/@href'):
             full_url = urljoin(base_url, href)
-            parsed_url = urlparse(full_url)
+            # Lowercase once per link; every pattern below runs on this copy
+            lowered_url = full_url.lower()
+            parsed_url = urlparse(lowered_url)
 
             # Same domain and not visited
-            if parsed_url.netloc == base_domain and full_url not in self.visited_urls:
+            if parsed_url.netloc == base_domain and full_url not in visited_urls:
                 # Job-related patterns
-                if re.search(r'/job|/jobs|/careers|/apply|/view|/listing|/posting|/opportunities', 
-                           parsed_url.path, re.IGNORECASE):
+                if _JOB_PATH_RE.search(parsed_url.path):
                     links.append(full_url)
                 # Pagination
-                elif re.search(r'page=\d+|start=\d+|offset=\d+|p=\d+', parsed_url.query, re.IGNORECASE):
+                elif _PAGINATION_RE.search(parsed_url.query):
                     links.append(full_url)
                 # General job-related URLs
-                elif any(keyword in full_url.lower() for keyword in ['job', 'career', 'hiring', 'work', 'position']):
+                elif _JOB_KW_RE.search(lowered_url):
                     links.append(full_url)
 
         return links[:20]  # Limit to prevent too many links
 
-    def _parse_job_page(self, html_content: str, url: str) -> Optional[dict]:
+    async def _parse_job_page(self, html_content: str, url: str) -> Optional[dict]:
         """Parse job page to extract job details"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, 'lxml')
         
         extracted_data = {
             "job_title": None,
@@ -366,73 +716,32 @@ class EnhancedJobScraper:
             "date_posted": None
         }
 
-        # Extract job title
-        title_selectors = [
-            'h1[class*="title"]', 'h1[class*="job"]', 'h1[class*="position"]',
-            'h2[class*="title"]', 'h2[class*="job"]', 'h2[class*="position"]',
-            '.job-title', '.position-title', '.title', 'h1', 'h2'
-        ]
-        
-        for selector in title_selectors:
-            title_elem = soup.select_one(selector)
-            if title_elem and title_elem.get_text(strip=True):
-                extracted_data['job_title'] = title_elem.get_text(strip=True)
-                break
+        # Walk the tree once, keeping the best-ranked candidate for each field
+        best_rank = {}
+        for node in soup.descendants:
+            if not isinstance(node, Tag):
+                continue
 
-        # Extract job description
-        desc_selectors = [
-            '[class*="description"]', '[class*="job-description"]', '[class*="content"]',
-            '[class*="details"]', '[class*="requirements"]', '.description', '.job-content'
-        ]
-        
-        for selector in desc_selectors:
-            desc_elem = soup.select_one(selector)
-            if desc_elem:
-                desc_text = desc_elem.get_text(separator='\n', strip=True)
-                if len(desc_text) > 100:  # Ensure it's substantial
-                    extracted_data['job_description'] = desc_text[:2000]  # Limit length
-                    break
+            class_tokens = node.get('class') or []
+            cls = ' '.join(class_tokens).lower()
 
-        # Extract location
-        location_selectors = [
-            '[class*="location"]', '[class*="address"]', '[class*="remote"]', 
-            '.location', '.job-location', '.address'
-        ]
-        
-        for selector in location_selectors:
-            location_elem = soup.select_one(selector)
-            if location_elem and location_elem.get_text(strip=True):
-                extracted_data['job_location'] = location_elem.get_text(strip=True)
-                break
+            for field, selectors in FIELD_SELECTORS.items():
+                rank = _selector_rank(node, cls, class_tokens, selectors, best_rank.get(field))
+                if rank is None:
+                    continue
+                value = _field_value(node, field, url)
+                if value:
+                    extracted_data[field] = value
+                    best_rank[field] = rank
 
-        # Extract apply URL
-        apply_selectors = [
-            'a[href*="apply"]', 'a[class*="apply"]', 'a[class*="button"]',
-            '.apply-btn', '.apply-link', '.job-apply'
-        ]
-        
-        for selector in apply_selectors:
-            apply_elem = soup.select_one(selector)
-            if apply_elem and apply_elem.get('href'):
-                extracted_data['apply_url'] = urljoin(url, apply_elem['href'])
+            # Nothing can beat a top-ranked candidate for every field
+            if len(best_rank) == len(FIELD_SELECTORS) and not any(best_rank.values()):
                 break
 
         # Default apply URL to current URL if not found
         if not extracted_data['apply_url']:
             extracted_data['apply_url'] = url
 
-        # Extract company image
-        img_selectors = [
-            'img[src*="logo"]', 'img[class*="logo"]', 'img[class*="company"]',
-            '.company-logo img', '.logo img'
-        ]
-        
-        for selector in img_selectors:
-            img_elem = soup.select_one(selector)
-            if img_elem and img_elem.get('src'):
-                extracted_data['company_image'] = urljoin(url, img_elem['src'])
-                break
-
         # Use OLLama to fill missing fields
         mandatory_missing = not all([
             extracted_data['job_title'],
@@ -442,7 +751,8 @@ class EnhancedJobScraper:
 
         if mandatory_missing:
             logger.info(f"Using OLLama to fill missing fields for {url}")
-            ollama_data = get_job_details_with_ollama(html_content, url)
+            ollama_data = await get_job_details_with_ollama(self._get_session(), soup, url,
+                                                            use_cache=self.use_cache)
             
             for key in extracted_data:
                 if not extracted_data[key] and ollama_data.get(key):
@@ -455,77 +765,173 @@ class EnhancedJobScraper:
 
         return extracted_data
 
-    def crawl(self):
-        """Main crawling method"""
+    async def _queue_job(self, job_data: dict) -> bool:
+        """Queue a job for the API, flushing once a full batch is pending"""
+        try:
+            body = build_api_payload(job_data)
+        except Exception as e:
+            logger.error(f"Error pushing job to API: {e}")
+            return False
+
+        self._pending.append((job_data, body))
+        if len(self._pending) >= API_BATCH_SIZE:
+            await self._flush_pending()
+        return True
+
+    async def _flush_pending(self):
+        """Push all queued jobs, in one bulk request when the API supports it"""
+        if not self._pending:
+            return
+
+        # Swap the batch out before awaiting so concurrent tasks keep queueing
+        batch, self._pending = self._pending, []
+        session = self._get_session()
+        bodies = [body for _, body in batch]
+
+        results = None
+        if self._bulk_supported:
+            bulk_result = await push_jobs_to_api_bulk(session, bodies)
+            if bulk_result == BULK_UNSUPPORTED:
+                logger.info("Bulk API endpoint unavailable, pushing jobs individually")
+                self._bulk_supported = False
+            elif bulk_result == BULK_REJECTED:
+                logger.warning(f"Bulk push rejected, retrying {len(batch)} jobs individually")
+            else:
+                # On 5xx/timeouts the server may have stored part of the batch,
+                # so resending individually could create duplicates
+                results = [bulk_result == BULK_OK] * len(batch)
+
+        if results is None:
+            # Pipeline the individual POSTs over the kept-alive connection pool
+            results = await asyncio.gather(*[push_job_to_api(session, body, job_data['job_title'])
+                                             for job_data, body in batch])
+
+        for (job_data, _), pushed in zip(batch, results):
+            if pushed:
+                self.scraped_jobs.append(job_data)
+            else:
+                logger.warning(f"Failed to push job: {job_data['job_title']}")
+
+    async def _process(self, url: str, visited_urls: ScalableBloomFilter) -> tuple:
+        """Fetch, parse and queue a single URL; returns (job_queued, new_links)"""
+        html_content = await self._fetch_page(url)
+        if not html_content:
+            return False, []
+
+        # Different URLs (tracking params, session ids) often serve identical pages
+        content_hash = blake3(html_content.encode()).digest()
+        if content_hash in self._content_hashes:
+            logger.info(f"Skipping duplicate content at {url}")
+            return False, []
+        self._content_hashes.add(content_hash)
+
+        queued = False
+        job_data = await self._parse_job_page(html_content, url)
+
+        if job_data:
+            # Queue for the next API batch
+            if await self._queue_job(job_data):
+                queued = True
+                logger.info(f"✓ Job found and queued: {job_data['job_title']}")
+
+        # Extract more links
+        return queued, self._extract_links(html_content, url, visited_urls)
+
+    async def _crawl_domain(self, start_url: str):
+        """BFS crawl of a single domain; frontier and visited set are local to the task"""
+        domain = urlparse(start_url).netloc
+        queue = deque([start_url])
+        visited_urls = ScalableBloomFilter(initial_capacity=VISITED_INITIAL_CAPACITY,
+                                           error_rate=VISITED_ERROR_RATE)
+        visited_urls.add(start_url)
+        
+        pages_crawled = 0
+        queued_jobs = 0
+        
+        logger.info(f"Starting crawl for {domain}")
+
+        while queue and pages_crawled < self.max_pages_per_domain:
+            # Drain the BFS frontier in waves of concurrent fetches
+            wave_size = min(self.per_domain_concurrency, self.max_pages_per_domain - pages_crawled)
+            batch = [queue.popleft() for _ in range(min(wave_size, len(queue)))]
+
+            results = await asyncio.gather(*[self._process(url, visited_urls) for url in batch])
+
+            for queued, new_links in results:
+                if queued:
+                    queued_jobs += 1
+                for link in new_links:
+                    if link not in visited_urls and len(queue) < 50:
+                        visited_urls.add(link)
+                        queue.append(link)
+            
+            pages_crawled += len(batch)
+            
+            # Add random delay to avoid being blocked
+            await asyncio.sleep(random.uniform(2, 5))
+        
+        logger.info(f"Finished {domain}: {queued_jobs} jobs queued from {pages_crawled} pages")
+
+    async def crawl(self):
+        """Main crawling method; domains are crawled concurrently"""
         start_urls = self._load_start_urls()
         if not start_urls:
             logger.error("No starting URLs found")
             return
 
-        for start_url in start_urls:
-            domain = urlparse(start_url).netloc
-            self.queue.clear()
-            self.visited_urls.clear()
-            self.queue.append(start_url)
-            self.visited_urls.add(start_url)
-            
-            pages_crawled = 0
-            successful_jobs = 0
-            
-            logger.info(f"Starting crawl for {domain}")
+        results = await asyncio.gather(*[self._crawl_domain(url) for url in start_urls],
+                                       return_exceptions=True)
 
-            while self.queue and pages_crawled < self.max_pages_per_domain:
-                current_url = self.queue.popleft()
-                
-                html_content = self._fetch_page(current_url)
-                if html_content:
-                    job_data = self._parse_job_page(html_content, current_url)
-                    
-                    if job_data:
-                        # Push to API
-                        if push_job_to_api(job_data):
-                            successful_jobs += 1
-                            self.scraped_jobs.append(job_data)
-                            logger.info(f"✓ Job found and pushed: {job_data['job_title']}")
-                        else:
-                            logger.warning(f"Failed to push job: {job_data['job_title']}")
-                    
-                    # Extract more links
-                    new_links = self._extract_links(html_content, current_url)
-                    for link in new_links:
-                        if link not in self.visited_urls and len(self.queue) < 50:
-                            self.visited_urls.add(link)
-                            self.queue.append(link)
-                
-                pages_crawled += 1
-                
-                # Add random delay to avoid being blocked
-                time.sleep(random.uniform(2, 5))
-            
-            logger.info(f"Finished {domain}: {successful_jobs} jobs from {pages_crawled} pages")
+        for start_url, result in zip(start_urls, results):
+            if isinstance(result, Exception):
+                logger.error(f"Crawl failed for {start_url}: {result}")
+
+        await self._flush_pending()
+        logger.info(f"Pushed {len(self.scraped_jobs)} jobs to API")
 
     def save_jobs_to_json(self, filename: str = "scraped_jobs.json"):
         """Save scraped jobs to JSON file"""
         if self.scraped_jobs:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(self.scraped_jobs, f, indent=2, ensure_ascii=False, default=str)
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(self.scraped_jobs, option=orjson.OPT_INDENT_2, default=str))
             logger.info(f"Saved {len(self.scraped_jobs)} jobs to {filename}")
         else:
             logger.warning("No jobs to save")
 
-    def cleanup(self):
+    async def cleanup(self):
         """Clean up resources"""
-        if self.driver:
-            self.driver.quit()
-        self.session.close()
+        if self.session and not self.session.closed:
+            try:
+                # Push anything left over if the crawl was interrupted
+                await self._flush_pending()
+            finally:
+                await self.session.close()
+
+        # A crashed or disconnected browser can raise on teardown; don't let that escape
+        if self._browser:
+            try:
+                await self._browser.close()
+            except Exception as e:
+                logger.warning(f"Error closing headless browser: {e}")
+            self._browser = None
+        if self._playwright:
+            try:
+                await self._playwright.stop()
+            except Exception as e:
+                logger.warning(f"Error stopping Playwright: {e}")
+            self._playwright = None
+
+async def main():
+    parser = argparse.ArgumentParser(description="Hireonova job scraper")
+    parser.add_argument('--no-cache', action='store_true', help="Bypass the on-disk OLLama extraction cache")
+    args = parser.parse_args()
 
-def main():
     urls_file = 'urls.json'
     
     # Create example URLs file
     try:
-        with open(urls_file, 'x') as f:
-            json.dump({
+        with open(urls_file, 'xb') as f:
+            f.write(orjson.dumps({
                 "urls": [
                     "https://remoteok.com/remote-dev-jobs",
                     "https://weworkremotely.com/remote-jobs",
@@ -533,7 +939,7 @@ def main():
                     "https://jobs.lever.co/",
                     "https://boards.greenhouse.io/",
                 ]
-            }, f, indent=2)
+            }, option=orjson.OPT_INDENT_2))
         logger.info(f"Created example {urls_file}")
     except FileExistsError:
         pass
@@ -542,14 +948,15 @@ def main():
         urls_file=urls_file,
         delay=3,
         timeout=30,
-        use_selenium=True
+        use_browser=True,
+        use_cache=not args.no_cache
     )
     
     try:
-        scraper.crawl()
+        await scraper.crawl()
         scraper.save_jobs_to_json()
     finally:
-        scraper.cleanup()
+        await scraper.cleanup()
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -0,0 +1,50 @@
+import hashlib
+import os
+import tempfile
+import time
+import logging
+import orjson
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# --- On-disk cache for OLLama extractions ---
+CACHE_DIR = "./ollama_cache"
+CACHE_TTL_SECONDS = 7 * 24 * 60 * 60  # 7 days
+PROMPT_VERSION = "v2"
+
+def make_key(model: str, url: str, content: str) -> str:
+    """Content-addressable key for an extraction request"""
+    return hashlib.sha256(f"{model}|{PROMPT_VERSION}|{url}|".encode() + content.encode()).hexdigest()
+
+def _path(key: str) -> str:
+    return os.path.join(CACHE_DIR, f"{key}.json")
+
+def get(key: str) -> Optional[dict]:
+    """Return the cached extraction for key, or None if missing or expired"""
+    path = _path(key)
+    try:
+        if time.time() - os.path.getmtime(path) > CACHE_TTL_SECONDS:
+            return None
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    except FileNotFoundError:
+        return None
+    except (OSError, orjson.JSONDecodeError) as e:
+        logger.warning(f"Could not read OLLama cache entry {key}: {e}")
+        return None
+
+def set(key: str, data: dict) -> None:
+    """Store an extraction for key, writing atomically via os.replace"""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(orjson.dumps(data))
+            os.replace(tmp_path, _path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logger.warning(f"Could not write OLLama cache entry {key}: {e}")